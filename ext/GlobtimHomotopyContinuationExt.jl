@@ -16,6 +16,7 @@ function Globtim._solve_hc(
     power_of_two_denom,
     return_system,
     start_system,
+    compile = nothing,
 )
     pol = Globtim.main_nd(
         x,
@@ -37,7 +38,17 @@ function Globtim._solve_hc(
 
     grad = differentiate.(pol, x)
     sys = System(grad)
-    hc_result = solve(sys, start_system = actual_start, show_progress = false)
+    compile === nothing ||
+        compile isa Bool ||
+        compile in (:all, :mixed, :none) ||
+        throw(
+            ArgumentError(
+                "hc_compile must be nothing, true/false, :all, :mixed or :none; got $(repr(compile))",
+            ),
+        )
+    # Only pass `compile` when requested so HC keeps its own default otherwise
+    compile_kw = compile === nothing ? (;) : (; compile = compile)
+    hc_result = solve(sys; start_system = actual_start, show_progress = false, compile_kw...)
     rl_sol = real_solutions(hc_result; only_real = true, multiple_results = false)
 
     if return_system
@@ -39,6 +39,7 @@ import JSON3
 import TOML
 using Dates
 using Printf
+using LinearAlgebra: BLAS
 
 # ── Argument parsing ────────────────────────────────────────────────────────
 
@@ -64,6 +65,11 @@ function load_audit_section(path::String)
         # row. The scalar/vector spectrum fields are always logged; this
         # switch only gates the (heavier) per-shell mass dictionaries.
         log_mode_spectrum = Bool(get(audit, "log_mode_spectrum", true)),
+        # Optional BLAS pool size. Subdomain fits run serially here
+        # (parallel = false below) and thread_evals finishes before the Gram
+        # solve, so BLAS keeps its default unless this is set.
+        # 0 = one BLAS thread per Julia thread.
+        blas_threads = haskey(audit, "blas_threads") ? Int(audit["blas_threads"]) : nothing,
     )
 end
 
@@ -472,6 +478,11 @@ function main()
     config = Globtim.load_experiment_config(path)
     audit_cfg = load_audit_section(path)
     sampling_cfg = load_sampling_section(path)
+    if audit_cfg.blas_threads !== nothing
+        BLAS.set_num_threads(
+            audit_cfg.blas_threads > 0 ? audit_cfg.blas_threads : Threads.nthreads(),
+        )
+    end
 
     println("Loaded config: $(config.name)")
     println("  source: $path")
@@ -491,6 +502,7 @@ function main()
     println("  dim=$dim  bounds=$bounds")
     println("  base_degree=$base_degree  degree_step=$degree_step  max_degree=$max_degree")
     println("  max_leaves=$(audit_cfg.max_leaves)  l2_tol=$(audit_cfg.l2_tolerance)")
+    println("  julia_threads=$(Threads.nthreads())  blas_threads=$(BLAS.get_num_threads())")
     flush(stdout)
 
     output_dir = config.output_dir !== nothing ? config.output_dir : mktempdir()
@@ -585,7 +597,7 @@ function main()
                   n_leaves, length(records), wall)
 
     open(joinpath(output_dir, "audit_summary.json"), "w") do io
-        JSON3.pretty(io, (
+        JSON3.write(io, (
             generated  = string(Dates.now()),
             experiment = String(config.name),
             entry_name = obj_name,
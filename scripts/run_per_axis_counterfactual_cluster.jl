@@ -24,6 +24,7 @@
 #       max_depth = 10              # optional, default 10
 #       experiment_filter = "lv4d_audit_deg2_leaves32"  # optional; restrict
 #           # to predcall rows whose `experiment` field matches
+#       blas_threads = 1            # optional; 0 = one per Julia thread
 #   [output]  dir = "globtim_results/cluster/per_axis_audit/.../cf_budget16"
 #
 # Usage:
@@ -44,6 +45,7 @@ import JSON3
 import TOML
 using Dates
 using Printf
+using LinearAlgebra: BLAS
 
 # ── Argument parsing ────────────────────────────────────────────────────────
 
@@ -139,6 +141,9 @@ function load_cf_section(path::String)
         # Stratified subsample: at most N leaves per stage-1 experiment,
         # evenly spaced along the depth-sorted list (0 = no cap).
         per_experiment_cap   = Int(get(cf, "per_experiment_cap", 0)),
+        # BLAS pool size; 1 leaves parallelism to adaptive_refine's threaded
+        # subdomain fits (parallel = true), 0 = one BLAS thread per Julia thread.
+        blas_threads         = Int(get(cf, "blas_threads", 1)),
     )
 end
 
@@ -303,6 +308,7 @@ function main()
     path = parse_args(ARGS)
     config = Globtim.load_experiment_config(path)
     cf_cfg = load_cf_section(path)
+    BLAS.set_num_threads(cf_cfg.blas_threads > 0 ? cf_cfg.blas_threads : Threads.nthreads())
 
     println("Loaded config: $(config.name)")
 
@@ -328,6 +334,7 @@ function main()
     println("  degree_step=$degree_step (base_degree, max_degree from leaf JSONL)")
     println("  budget=$(cf_cfg.max_leaves_per_child)  l2_tol_cfg=$l2_tol_cfg")
     println("  predcall_dir: $(cf_cfg.predcall_dir)")
+    println("  julia_threads=$(Threads.nthreads())  blas_threads=$(BLAS.get_num_threads())")
 
     leaves = load_disagreements(cf_cfg.predcall_dir;
                                 experiment_filter = cf_cfg.experiment_filter,
@@ -485,7 +492,7 @@ function main()
     end
 
     open(joinpath(output_dir, "summary.json"), "w") do io
-        JSON3.pretty(io, (
+        JSON3.write(io, (
             generated  = string(Dates.now()),
             experiment = String(config.name),
             entry_name = obj_name,
@@ -171,7 +171,7 @@ TimerOutputs.@timeit _TO function lambda_vandermonde_original(
         # Special handling for exact types vs floating point
         if T <: Rational || T <: Integer
             # Use recurrence relation for exact computation
-            @info "  🚀 lambda_vandermonde_original: Using EXACT recurrence (Rational/Integer)"
+            @debug "lambda_vandermonde_original: using exact recurrence (Rational/Integer)"
             for degree in 0:max_degree
                 eval_cache[degree] = T[]
                 for point in unique_points
@@ -181,7 +181,7 @@ TimerOutputs.@timeit _TO function lambda_vandermonde_original(
         else
             # OPTIMIZATION: Use recurrence relation instead of trig functions
             # This matches the optimization in lambda_vandermonde_tensorized.jl
-            @info "  🚀 lambda_vandermonde_original: Using OPTIMIZED recurrence (Float type)"
+            @debug "lambda_vandermonde_original: using recurrence (Float type)"
 
             # Pre-allocate all degree vectors
             for degree in 0:max_degree
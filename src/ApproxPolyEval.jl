@@ -36,40 +36,59 @@ function evaluate(poly::ApproxPoly, x::AbstractVector{T})::T where {T<:Real}
     # Get dimension
     n = length(x)
 
-    # Validate dimensions
-    lambda = Matrix(poly.support)  # Convert Adjoint to Matrix if needed
-    n_terms = size(lambda, 1)
-    n_dims = size(lambda, 2)
+    # Support transposed (n_dims × n_terms): one copy, used by every branch below
+    lambda_t = permutedims(poly.support)
+    n_dims = size(lambda_t, 1)
 
+    # Validate dimensions
     if n != n_dims
         throw(DimensionMismatch("Expected point of dimension $n_dims, got $n"))
     end
 
     # Get max degree for caching
-    max_degree = maximum(lambda)
+    max_degree = maximum(lambda_t)
+
+    # 1D Chebyshev: a plain series in T_d, evaluated by Clenshaw without a basis table
+    if n == 1 && poly.basis == :chebyshev
+        c = _dense_chebyshev_coeffs(poly.coeffs, lambda_t', poly.normalized, max_degree)
+        return _clenshaw_chebyshev(c, x_scaled[1])
+    end
 
     # Pre-compute normalized basis polynomial values at each coordinate
     # basis_evals[k, d+1] = value of T_d(x_k) or P_d(x_k) with normalization
     # Use eltype of x_scaled to support ForwardDiff Dual numbers
     basis_evals = Matrix{eltype(x_scaled)}(undef, n, max_degree + 1)
+    _fill_basis_evals!(basis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
 
-    for k in 1:n
+    return _sum_basis_terms(poly.coeffs, lambda_t, basis_evals)
+end
+
+# Fill basis_evals[k, d+1] with the (optionally normalized) degree-d Chebyshev or
+# Legendre polynomial at x_scaled[k], for d = 0:max_degree.
+function _fill_basis_evals!(
+    basis_evals::AbstractMatrix,
+    x_scaled::AbstractVector,
+    basis::Symbol,
+    normalized::Bool,
+    max_degree::Int,
+)
+    for k in eachindex(x_scaled)
         xk = x_scaled[k]
 
-        if poly.basis == :chebyshev
+        if basis == :chebyshev
             # Chebyshev recurrence: T_0=1, T_1=x, T_n = 2x*T_{n-1} - T_{n-2}
             T_prev = one(xk)  # T_0
             T_curr = xk       # T_1
 
             # Apply normalization: T_0 normalized by 1/sqrt(π), T_n by sqrt(2/π)
-            if poly.normalized
+            if normalized
                 basis_evals[k, 1] = T_prev / sqrt(π)  # T_0 normalized
             else
                 basis_evals[k, 1] = T_prev
             end
 
             if max_degree >= 1
-                if poly.normalized
+                if normalized
                     basis_evals[k, 2] = T_curr * sqrt(2 / π)  # T_1 normalized
                 else
                     basis_evals[k, 2] = T_curr
@@ -78,7 +97,7 @@ function evaluate(poly::ApproxPoly, x::AbstractVector{T})::T where {T<:Real}
 
             for d in 2:max_degree
                 T_next = 2 * xk * T_curr - T_prev
-                if poly.normalized
+                if normalized
                     basis_evals[k, d+1] = T_next * sqrt(2 / π)
                 else
                     basis_evals[k, d+1] = T_next
@@ -92,14 +111,14 @@ function evaluate(poly::ApproxPoly, x::AbstractVector{T})::T where {T<:Real}
             P_curr = xk       # P_1
 
             # Apply normalization: P_n normalized by sqrt((2n+1)/2)
-            if poly.normalized
+            if normalized
                 basis_evals[k, 1] = P_prev * sqrt(0.5)  # sqrt((2*0+1)/2) = sqrt(0.5)
             else
                 basis_evals[k, 1] = P_prev
             end
 
             if max_degree >= 1
-                if poly.normalized
+                if normalized
                     basis_evals[k, 2] = P_curr * sqrt(1.5)  # sqrt((2*1+1)/2) = sqrt(1.5)
                 else
                     basis_evals[k, 2] = P_curr
@@ -108,7 +127,7 @@ function evaluate(poly::ApproxPoly, x::AbstractVector{T})::T where {T<:Real}
 
             for d in 2:max_degree
                 P_next = ((2d - 1) * xk * P_curr - (d - 1) * P_prev) / d
-                if poly.normalized
+                if normalized
                     basis_evals[k, d+1] = P_next * sqrt((2d + 1) / 2)
                 else
                     basis_evals[k, d+1] = P_next
@@ -118,27 +137,52 @@ function evaluate(poly::ApproxPoly, x::AbstractVector{T})::T where {T<:Real}
             end
         end
     end
+    return basis_evals
+end
+
+# Collapse a 1D Chebyshev support (degrees in any order, possibly sparse) into a
+# dense coefficient vector c[d+1] for T_d, folding in the normalization weights.
+function _dense_chebyshev_coeffs(
+    coeffs::AbstractVector,
+    lambda::AbstractMatrix{<:Integer},
+    normalized::Bool,
+    max_degree::Int,
+)
+    c = zeros(float(eltype(coeffs)), max_degree + 1)
+    for j in eachindex(coeffs)
+        d = lambda[j, 1]
+        w = normalized ? (d == 0 ? 1 / sqrt(π) : sqrt(2 / π)) : 1
+        c[d+1] += coeffs[j] * w
+    end
+    return c
+end
 
-    # Evaluate: sum over all basis terms
-    # Each term is c_j * prod_k(basis_k(degree_jk))
-    result = zero(eltype(x_scaled))
+# Sum c_j * prod_k basis_k(degree_jk) over all terms. `lambda_t` is the support
+# transposed (n_dims × n_terms) so the inner loop walks a contiguous column.
+function _sum_basis_terms(coeffs, lambda_t::AbstractMatrix{<:Integer}, basis_evals)
+    T = eltype(basis_evals)
+    n, n_terms = size(lambda_t)
+    result = zero(T)
     for j in 1:n_terms
-        term = one(eltype(x_scaled))
+        term = one(T)
         for k in 1:n
-            deg = lambda[j, k]
-            term *= basis_evals[k, deg+1]
+            term *= basis_evals[k, lambda_t[k, j]+1]
         end
-        result += poly.coeffs[j] * term
+        result += coeffs[j] * term
     end
-
     return result
 end
 
 """
     gradient(poly::ApproxPoly, x::AbstractVector{<:Real})::Vector{Float64}
 
-Compute gradient of polynomial approximation at point `x` using automatic differentiation.
+Compute gradient of polynomial approximation at point `x`.
 
+All `n` partial derivatives are computed analytically in one sweep over the support:
+basis values and basis derivatives come from the three-term recurrences
+(`T'_d = 2T_{d-1} + 2x T'_{d-1} - T'_{d-2}`, and the Legendre analogue), and each term
+contributes `c_j ∂_k ∏_l B_l` to every component. In 1D with the Chebyshev basis the
+derivative series is formed directly (`c'ₖ₋₁ = c'ₖ₊₁ + 2k cₖ`) and evaluated by Clenshaw.
 The gradient is computed in the original (unscaled) domain coordinates.
 
 # Arguments
@@ -155,7 +199,113 @@ grad = gradient(poly, [0.5, 0.3])
 ```
 """
 function gradient(poly::ApproxPoly, x::AbstractVector{<:Real})::Vector{Float64}
-    return ForwardDiff.gradient(z -> evaluate(poly, z), collect(x))
+    n = length(x)
+    lambda_t = permutedims(poly.support)
+    n_dims = size(lambda_t, 1)
+
+    if n != n_dims
+        throw(DimensionMismatch("Expected point of dimension $n_dims, got $n"))
+    end
+
+    max_degree = maximum(lambda_t)
+    x_scaled = (x .- poly.center) ./ poly.scale_factor
+
+    # 1D Chebyshev: differentiate the series coefficients and evaluate by Clenshaw
+    if n == 1 && poly.basis == :chebyshev
+        c = _dense_chebyshev_coeffs(poly.coeffs, lambda_t', poly.normalized, max_degree)
+        dc = _chebyshev_derivative_coeffs(c)
+        return [_clenshaw_chebyshev(dc, x_scaled[1]) / _scale_at(poly.scale_factor, 1)]
+    end
+
+    basis_evals = Matrix{Float64}(undef, n, max_degree + 1)
+    dbasis_evals = Matrix{Float64}(undef, n, max_degree + 1)
+    _fill_basis_evals!(basis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
+    _fill_basis_derivs!(dbasis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
+
+    grad = zeros(n)
+    _accumulate_gradient!(
+        grad,
+        Vector{Float64}(undef, n),
+        poly.coeffs,
+        lambda_t,
+        basis_evals,
+        dbasis_evals,
+    )
+
+    # Chain rule for x_scaled = (x - center) / scale_factor
+    for k in 1:n
+        grad[k] /= _scale_at(poly.scale_factor, k)
+    end
+    return grad
+end
+
+# Normalization weight applied to the degree-d basis polynomial (matches _fill_basis_evals!)
+_basis_norm(basis::Symbol, d::Int) =
+    basis == :chebyshev ? (d == 0 ? 1 / sqrt(π) : sqrt(2 / π)) : sqrt((2d + 1) / 2)
+
+# Fill dbasis_evals[k, d+1] with the derivative of the (optionally normalized) degree-d
+# basis polynomial at x_scaled[k], differentiating the three-term recurrences:
+#   Chebyshev: T'_d = 2T_{d-1} + 2x T'_{d-1} - T'_{d-2}
+#   Legendre:  P'_d = ((2d-1)(P_{d-1} + x P'_{d-1}) - (d-1) P'_{d-2}) / d
+function _fill_basis_derivs!(
+    dbasis_evals::AbstractMatrix,
+    x_scaled::AbstractVector,
+    basis::Symbol,
+    normalized::Bool,
+    max_degree::Int,
+)
+    for k in eachindex(x_scaled)
+        xk = x_scaled[k]
+        p_prev, p_curr = one(xk), xk          # P_0, P_1
+        dp_prev, dp_curr = zero(xk), one(xk)  # P'_0, P'_1
+
+        dbasis_evals[k, 1] = dp_prev
+        if max_degree >= 1
+            dbasis_evals[k, 2] = normalized ? dp_curr * _basis_norm(basis, 1) : dp_curr
+        end
+
+        for d in 2:max_degree
+            if basis == :chebyshev
+                p_next = 2 * xk * p_curr - p_prev
+                dp_next = 2 * p_curr + 2 * xk * dp_curr - dp_prev
+            else  # :legendre
+                p_next = ((2d - 1) * xk * p_curr - (d - 1) * p_prev) / d
+                dp_next = ((2d - 1) * (p_curr + xk * dp_curr) - (d - 1) * dp_prev) / d
+            end
+            dbasis_evals[k, d+1] = normalized ? dp_next * _basis_norm(basis, d) : dp_next
+            p_prev, p_curr = p_curr, p_next
+            dp_prev, dp_curr = dp_curr, dp_next
+        end
+    end
+    return dbasis_evals
+end
+
+# grad[k] += Σ_j c_j B'_k(λ_jk) ∏_{l≠k} B_l(λ_jl), in reference coordinates. The
+# products over l≠k come from prefix products (stored in `prefix`) times a running
+# suffix product, so each term costs O(n) for all n components.
+function _accumulate_gradient!(
+    grad::AbstractVector,
+    prefix::AbstractVector,
+    coeffs,
+    lambda_t::AbstractMatrix{<:Integer},
+    basis_evals,
+    dbasis_evals,
+)
+    n, n_terms = size(lambda_t)
+    for j in 1:n_terms
+        acc = one(eltype(prefix))
+        for k in 1:n
+            prefix[k] = acc
+            acc *= basis_evals[k, lambda_t[k, j]+1]
+        end
+        suffix = one(eltype(prefix))
+        for k in n:-1:1
+            deg = lambda_t[k, j]
+            grad[k] += coeffs[j] * prefix[k] * suffix * dbasis_evals[k, deg+1]
+            suffix *= basis_evals[k, deg+1]
+        end
+    end
+    return grad
 end
 
 """
@@ -171,10 +321,99 @@ Evaluate polynomial approximation at multiple points.
 - `Vector{Float64}`: Values at each point
 """
 function evaluate(poly::ApproxPoly, X::AbstractMatrix{<:Real})::Vector{Float64}
-    n_points = size(X, 1)
+    n_points, n = size(X)
+
+    # Support, max degree and the basis table are point-independent: build them
+    # once and reuse across rows instead of once per evaluate(poly, x) call.
+    lambda_t = permutedims(poly.support)
+    if n != size(lambda_t, 1)
+        throw(DimensionMismatch("Expected point of dimension $(size(lambda_t, 1)), got $n"))
+    end
+    max_degree = maximum(lambda_t)
     values = Vector{Float64}(undef, n_points)
+
+    if n == 1 && poly.basis == :chebyshev
+        c = _dense_chebyshev_coeffs(poly.coeffs, lambda_t', poly.normalized, max_degree)
+        for i in 1:n_points
+            x1 = (X[i, 1] - poly.center[1]) / _scale_at(poly.scale_factor, 1)
+            values[i] = _clenshaw_chebyshev(c, x1)
+        end
+        return values
+    end
+
+    basis_evals = Matrix{Float64}(undef, n, max_degree + 1)
+    x_scaled = Vector{Float64}(undef, n)
     for i in 1:n_points
-        values[i] = evaluate(poly, view(X, i, :))
+        for k in 1:n
+            x_scaled[k] = (X[i, k] - poly.center[k]) / _scale_at(poly.scale_factor, k)
+        end
+        _fill_basis_evals!(basis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
+        values[i] = _sum_basis_terms(poly.coeffs, lambda_t, basis_evals)
     end
     return values
 end
+
+"""
+    gradient(poly::ApproxPoly, X::AbstractMatrix{<:Real})::Matrix{Float64}
+
+Compute the gradient of the polynomial approximation at multiple points.
+
+The support, basis tables and (in 1D Chebyshev) the derivative series are built once
+and reused for every row.
+
+# Arguments
+- `poly::ApproxPoly`: The polynomial approximation object
+- `X::AbstractMatrix{<:Real}`: Points as rows (n_points × n_dims)
+
+# Returns
+- `Matrix{Float64}`: Gradients as rows (n_points × n_dims)
+"""
+function gradient(poly::ApproxPoly, X::AbstractMatrix{<:Real})::Matrix{Float64}
+    n_points, n = size(X)
+
+    lambda_t = permutedims(poly.support)
+    if n != size(lambda_t, 1)
+        throw(DimensionMismatch("Expected point of dimension $(size(lambda_t, 1)), got $n"))
+    end
+    max_degree = maximum(lambda_t)
+    grads = zeros(n_points, n)
+
+    if n == 1 && poly.basis == :chebyshev
+        c = _dense_chebyshev_coeffs(poly.coeffs, lambda_t', poly.normalized, max_degree)
+        dc = _chebyshev_derivative_coeffs(c)
+        s1 = _scale_at(poly.scale_factor, 1)
+        for i in 1:n_points
+            grads[i, 1] = _clenshaw_chebyshev(dc, (X[i, 1] - poly.center[1]) / s1) / s1
+        end
+        return grads
+    end
+
+    basis_evals = Matrix{Float64}(undef, n, max_degree + 1)
+    dbasis_evals = Matrix{Float64}(undef, n, max_degree + 1)
+    x_scaled = Vector{Float64}(undef, n)
+    grad = Vector{Float64}(undef, n)
+    prefix = Vector{Float64}(undef, n)
+    for i in 1:n_points
+        for k in 1:n
+            x_scaled[k] = (X[i, k] - poly.center[k]) / _scale_at(poly.scale_factor, k)
+        end
+        _fill_basis_evals!(basis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
+        _fill_basis_derivs!(dbasis_evals, x_scaled, poly.basis, poly.normalized, max_degree)
+        fill!(grad, 0.0)
+        _accumulate_gradient!(
+            grad,
+            prefix,
+            poly.coeffs,
+            lambda_t,
+            basis_evals,
+            dbasis_evals,
+        )
+        for k in 1:n
+            grads[i, k] = grad[k] / _scale_at(poly.scale_factor, k)
+        end
+    end
+    return grads
+end
+
+_scale_at(scale_factor::Real, k::Int) = scale_factor
+_scale_at(scale_factor::AbstractVector, k::Int) = scale_factor[k]
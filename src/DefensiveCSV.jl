@@ -198,7 +198,7 @@ function defensive_csv_read(
             # Check for potential L2 norm issues
             if "z" in names(df)
                 z_values = collect(skipmissing(df.z))
-                if !isempty(z_values) && all(isa.(z_values, Number))
+                if !isempty(z_values) && all(z -> z isa Number, z_values)
                     if any(z -> z < 0, z_values)
                         push!(
                             warnings,
@@ -45,7 +45,7 @@ end
 @doc nothing function Ackley(xx::AbstractVector; a = 20, b = 0.2, c = 2 * pi)
     n = length(xx)
     # Use map instead of broadcasting for better StaticArrays performance
-    sum_sq = sum(x^2 for x in xx) / n
+    sum_sq = sum(abs2, xx) / n
     sum_cos = sum(cos(c * x) for x in xx) / n
     return -a * exp(-b * sqrt(sum_sq)) - exp(sum_cos) + a + exp(1)
 end
@@ -233,7 +233,7 @@ end
 
     for i in n_gaussians
         diff = xx .- view(params.centers, i, :)  # Use view for better memory efficiency
-        gaussian[i] = exp(-sum(diff .^ 2) / (2 * params.variances[i]^2))
+        gaussian[i] = exp(-sum(abs2, diff) / (2 * params.variances[i]^2))
     end
 
     if verbose
@@ -335,6 +335,8 @@ f(x,y) = (exp(x² + y²) - 3)² + (x + y - sin(3(x + y)))²
 - Smooth, differentiable everywhere
 - Challenging for local optimization methods
 - Good test case for verifying global optimization algorithms
+- Even: f(-x) = f(x), so `Constructor(TR, d; symmetry = :even)` halves the
+  sampling cost when `TR` is centered at the origin
 
 # Examples
 ```julia
@@ -577,7 +579,7 @@ TR = TestInput(Sphere, dim=10, center=zeros(10), sample_range=5.12)
 """
 function Sphere end  # Declare as new generic function (not extension of Optim.Sphere)
 function Sphere(x::AbstractVector)
-    return sum(xi^2 for xi in x)
+    return sum(abs2, x)
 end
 
 """
@@ -675,7 +677,7 @@ TR = TestInput(Griewank, dim=10, center=zeros(10), sample_range=600.0)
 """
 function Griewank(x::AbstractVector)
     n = length(x)
-    sum_term = sum(xi^2 for xi in x) / 4000
+    sum_term = sum(abs2, x) / 4000
     prod_term = prod(cos(x[i] / sqrt(i)) for i in 1:n)
     return 1 + sum_term - prod_term
 end
@@ -829,7 +831,7 @@ TR = TestInput(Zakharov, dim=10, center=zeros(10), sample_range=5.0)
 function Zakharov(x::AbstractVector)
     n = length(x)
 
-    term1 = sum(xi^2 for xi in x)
+    term1 = sum(abs2, x)
 
     sum_weighted = sum(0.5 * i * x[i] for i in 1:n)
     term2 = sum_weighted^2
@@ -26,6 +26,46 @@ function print_timing_breakdown(; reset::Bool = true)
     end
 end
 
+"""
+    _mixed_precision_solve(A, b; maxiter=30) -> Vector{Float64}
+
+Solve `A x = b` by factorizing `A` once in Float32 and refining the solution
+with Float64 residuals (the LAPACK `dsgesv` scheme). Stops once
+`‖b - A x‖∞ < ‖x‖∞ ‖A‖∞ eps(Float64) √m`. Errors if the Float32 factorization
+is singular or the refinement does not converge — `A` is then too
+ill-conditioned for Float32 and the solve must be run with
+`mixed_precision=false`.
+"""
+function _mixed_precision_solve(
+    A::AbstractMatrix{Float64},
+    b::AbstractVector{Float64};
+    maxiter::Int = 30,
+)
+    m = size(A, 1)
+    lu32 = lu(Float32.(A); check = false)
+    if !issuccess(lu32)
+        error(
+            "mixed_precision: Float32 LU factorization of the $(m)×$(m) Gram matrix " *
+            "is singular. Use mixed_precision=false for this system.",
+        )
+    end
+
+    x = Float64.(lu32 \ Float32.(b))
+    cte = opnorm(A, Inf) * eps(Float64) * sqrt(m)
+    for _ in 1:maxiter
+        r = b - A * x
+        if norm(r, Inf) < norm(x, Inf) * cte
+            return x
+        end
+        x .+= lu32 \ Float32.(r)
+    end
+    error(
+        "mixed_precision: iterative refinement did not converge in $(maxiter) steps " *
+        "for the $(m)×$(m) Gram matrix (too ill-conditioned for a Float32 " *
+        "factorization). Use mixed_precision=false for this system.",
+    )
+end
+
 """
     MainGenerate(
         f,
@@ -41,7 +81,11 @@ end
         GN::Union{Int,Nothing} = nothing,
         precision::PrecisionType = Float64Precision,
         normalized::Bool = true,
-        power_of_two_denom::Bool = false
+        power_of_two_denom::Bool = false,
+        thread_evals::Bool = false,
+        equilibrate::Bool = false,
+        mixed_precision::Bool = false,
+        symmetry::Symbol = :none
     )::ApproxPoly
 
 Compute the coefficients of a polynomial approximant of degree `d` in the specified basis.
@@ -63,6 +107,19 @@ Compute the coefficients of a polynomial approximant of degree `d` in the specif
 - `precision`: Precision type for coefficients
 - `normalized`: Whether to use normalized basis polynomials
 - `power_of_two_denom`: For rational precision, ensures denominators are powers of 2
+- `thread_evals`: Evaluate `f` on the grid with a chunked `Threads.@spawn` pool (caller guarantees thread safety)
+- `equilibrate`: Symmetrically rescale the Gram matrix to unit diagonal before the LU solve;
+  coefficients are unscaled afterwards and `cond_vandermonde` still refers to the unscaled matrix
+- `mixed_precision`: Factorize the Gram matrix in Float32 and refine the coefficients with
+  Float64 residuals (see `_mixed_precision_solve`); errors if the refinement does not converge
+- `symmetry`: `:none` (default) or `:even`. With `:even` the caller asserts
+  `f(center + s⊙x) == f(center - s⊙x)`; `f` is then evaluated on half of the generated
+  grid and mirrored onto the other half. Not allowed with a pre-generated grid.
+
+With `basis = :chebyshev` on the generated grid and all degrees ≤ `GN`, the Gram matrix is
+diagonal (discrete orthogonality of Chebyshev polynomials on Chebyshev nodes) and the
+coefficients are obtained by a diagonal scaling of `VL' * F`; `equilibrate` and
+`mixed_precision` only affect the general (dense) path.
 
 # Returns
 - `ApproxPoly`: An object containing the polynomial approximation and related data
@@ -87,10 +144,25 @@ TimerOutputs.@timeit _TO function MainGenerate(
     normalized::Bool = true,
     power_of_two_denom::Bool = false,
     thread_evals::Bool = false,
+    equilibrate::Bool = false,
+    mixed_precision::Bool = false,
+    symmetry::Symbol = :none,
 )::ApproxPoly
     # Check if d is a grid (Matrix format)
     grid_provided = isa(d, Matrix)
 
+    if !(symmetry in (:none, :even))
+        throw(ArgumentError("symmetry must be :none or :even, got :$symmetry"))
+    end
+    if grid_provided && symmetry != :none
+        throw(
+            ArgumentError(
+                "symmetry=:$symmetry needs the generated (centrally symmetric) tensor grid; " *
+                "it cannot be combined with a pre-generated grid",
+            ),
+        )
+    end
+
     if grid_provided
         # Validate grid dimensions
         @assert size(d, 2) == n "Grid dimension mismatch: expected $n, got $(size(d, 2))"
@@ -221,8 +293,18 @@ TimerOutputs.@timeit _TO function MainGenerate(
     if verbose >= 1
         @info "  🔢 Computing Gram matrix ($(size(VL, 2)) × $(size(VL, 2)))..."
     end
+    # Chebyshev basis on the generated Chebyshev (Gauss) tensor grid with every
+    # degree ≤ GN: by discrete orthogonality Σᵢ T_a(xᵢ) T_b(xᵢ) = 0 for a ≠ b, so the
+    # Gram matrix is diagonal and only the column norms of VL are needed — no m×m
+    # product, no factorization, and the condition number is max/min of the diagonal.
+    diagonal_gram =
+        basis == :chebyshev && !grid_provided && maximum(Lambda.data) <= actual_GN
     TimerOutputs.@timeit _TO "gram_matrix" begin
-        G_original = VL' * VL
+        G_original = if diagonal_gram
+            Diagonal(vec(sum(abs2, VL; dims = 1)))
+        else
+            VL' * VL
+        end
     end
     if verbose >= 1
         @info "  ✓ Gram matrix computed"
@@ -246,7 +328,7 @@ TimerOutputs.@timeit _TO function MainGenerate(
         if grid_provided
             # Grid is already in matrix format, create SVectors for evaluation
             grid_points = [
-                SVector{n,Float64}(matrix_from_grid[i, :]) for
+                SVector{n,Float64}(view(matrix_from_grid, i, :)) for
                 i in 1:size(matrix_from_grid, 1)
             ]
         else
@@ -265,33 +347,47 @@ TimerOutputs.@timeit _TO function MainGenerate(
                 x -> f(scale_factor * x + scaled_center)
             end
         else
-            function apply_scale(x)
-                scaled_x = SVector{n,Float64}([scale_factor[i] * x[i] for i in 1:n])
-                if n == 1
-                    return f((scaled_x+scaled_center)[1])
-                else
-                    return f(scaled_x + scaled_center)
-                end
+            # Convert once: the per-point scaling is then an allocation-free
+            # SVector broadcast instead of a fresh Vector per grid point.
+            scale_sv = SVector{n,Float64}(scale_factor)
+            if n == 1
+                x -> f((scale_sv .* x+scaled_center)[1])
+            else
+                x -> f(scale_sv .* x + scaled_center)
             end
-            apply_scale
         end
 
+        # The generated tensor grid is centrally symmetric: along every axis node i
+        # mirrors node GN+2-i, so linear indices i and N+1-i are mirror points. For an
+        # even objective only the first half needs evaluating.
+        n_all = length(grid_points)
+        eval_points = symmetry == :even ? view(grid_points, 1:cld(n_all, 2)) : grid_points
+
         if thread_evals && Threads.nthreads() > 1
             # Threaded fan-out: chunked @spawn, matching adaptive_subdivision.
             # Caller is responsible for f being thread-safe.
-            n_pts = length(grid_points)
+            n_pts = length(eval_points)
             F = Vector{Float64}(undef, n_pts)
             chunk_size = max(1, cld(n_pts, 4 * Threads.nthreads()))
             @sync for chunk_start in 1:chunk_size:n_pts
                 chunk_end = min(chunk_start + chunk_size - 1, n_pts)
                 Threads.@spawn begin
                     for i in chunk_start:chunk_end
-                        F[i] = eval_fn(grid_points[i])
+                        F[i] = eval_fn(eval_points[i])
                     end
                 end
             end
         else
-            F = map(eval_fn, grid_points)
+            F = map(eval_fn, eval_points)
+        end
+
+        if symmetry == :even
+            F_half = F
+            F = similar(F_half, n_all)
+            copyto!(F, F_half)
+            for i in (length(F_half)+1):n_all
+                F[i] = F_half[n_all+1-i]
+            end
         end
         eval_time = time() - eval_start
         if verbose >= 1 && eval_time > 1.0  # Only log if evaluation took significant time
@@ -307,6 +403,7 @@ TimerOutputs.@timeit _TO function MainGenerate(
         @info "  📐 Computing condition number..."
     end
     cond_vandermonde = TimerOutputs.@timeit _TO "condition_number" begin
+        diagonal_gram ? maximum(G_original.diag) / minimum(G_original.diag) :
         cond(G_original)
     end
     if verbose >= 1
@@ -318,16 +415,39 @@ TimerOutputs.@timeit _TO function MainGenerate(
     end
     TimerOutputs.@timeit _TO "linear_solve_vandermonde" begin
         RHS = VL' * F
-        linear_prob = LinearProblem(G_original, RHS)
-        # Use LU factorization to avoid QR pivot type issues in Julia 1.11
-        if verbose >= 1
-            sol = LinearSolve.solve(
-                linear_prob,
-                LinearSolve.LUFactorization(),
-                verbose = true,
-            )
+        if diagonal_gram
+            # Exact solve of the diagonal normal equations (equilibrate and
+            # mixed_precision have nothing to act on here)
+            sol = (u = RHS ./ G_original.diag,)
         else
-            sol = LinearSolve.solve(linear_prob, LinearSolve.LUFactorization())
+            G_solve, RHS_solve = G_original, RHS
+            if equilibrate
+                # Jacobi equilibration G̃ = D G D, D = diag(G)^(-1/2): unit diagonal, so
+                # the LU pivots no longer track the basis normalization. Costs O(m²)
+                # next to the O(m³) factorization; the solution is unscaled below.
+                dscale = [g > 0 ? inv(sqrt(g)) : 1.0 for g in diag(G_original)]
+                G_solve = dscale .* G_original .* dscale'
+                RHS_solve = dscale .* RHS
+            end
+            if mixed_precision
+                # Same field access as a LinearSolve solution (sol.u) for the code below
+                sol = (u = _mixed_precision_solve(G_solve, RHS_solve),)
+            else
+                linear_prob = LinearProblem(G_solve, RHS_solve)
+                # Use LU factorization to avoid QR pivot type issues in Julia 1.11
+                if verbose >= 1
+                    sol = LinearSolve.solve(
+                        linear_prob,
+                        LinearSolve.LUFactorization(),
+                        verbose = true,
+                    )
+                else
+                    sol = LinearSolve.solve(linear_prob, LinearSolve.LUFactorization())
+                end
+            end
+            if equilibrate
+                sol.u .*= dscale
+            end
         end
     end
     if verbose >= 1
@@ -406,6 +526,11 @@ polynomial of the specified degree.
 - `normalized::Bool=false`: Whether to normalize the polynomial
 - `power_of_two_denom::Bool=false`: Use power-of-two denominators for rationals
 - `grid::Union{Nothing,Matrix{Float64}}=nothing`: Pre-generated grid matrix (rows are points)
+- `thread_evals::Bool=false`: Evaluate the objective on the grid with multiple threads
+- `equilibrate::Bool=false`: Jacobi-equilibrate the Gram matrix before the linear solve
+- `mixed_precision::Bool=false`: Float32 factorization with Float64 iterative refinement
+- `symmetry::Symbol=:none`: Use `:even` for objectives with `f(center + x) == f(center - x)`
+  (e.g. `Deuflhard` about the origin) to evaluate only half of the sampling grid
 
 # Returns
 - `ApproxPoly`: Polynomial approximation object containing:
@@ -456,6 +581,9 @@ TimerOutputs.@timeit _TO function Constructor(
     power_of_two_denom::Bool = false,
     grid::Union{Nothing,Matrix{Float64}} = nothing,
     thread_evals::Bool = false,
+    equilibrate::Bool = false,
+    mixed_precision::Bool = false,
+    symmetry::Symbol = :none,
     stagnation_stop::Bool = false,
     stagnation_threshold::Float64 = 0.01,
 )
@@ -480,6 +608,9 @@ TimerOutputs.@timeit _TO function Constructor(
             normalized = normalized,
             power_of_two_denom = power_of_two_denom,
             thread_evals = thread_evals,
+            equilibrate = equilibrate,
+            mixed_precision = mixed_precision,
+            symmetry = symmetry,
         )
         if verbose >= 1
             @info "  L2-norm: $(p.nrm)"
@@ -502,6 +633,9 @@ TimerOutputs.@timeit _TO function Constructor(
             normalized = normalized,
             power_of_two_denom = power_of_two_denom,
             thread_evals = thread_evals,
+            equilibrate = equilibrate,
+            mixed_precision = mixed_precision,
+            symmetry = symmetry,
         )
         if verbose >= 1
             @info "  L2-norm: $(p.nrm)"
@@ -528,6 +662,9 @@ TimerOutputs.@timeit _TO function Constructor(
             normalized = normalized,
             power_of_two_denom = power_of_two_denom,
             thread_evals = thread_evals,
+            equilibrate = equilibrate,
+            mixed_precision = mixed_precision,
+            symmetry = symmetry,
         )
         push!(nrm_history, p.nrm)
         if !isnothing(T.tolerance) && p.nrm < T.tolerance
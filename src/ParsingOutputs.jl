@@ -28,6 +28,11 @@ function process_crit_pts(
     skip_filtering::Bool = false,
     kwargs...,
 )::DataFrame
+    # Nothing to filter, transform or evaluate (e.g. the solver found no real roots)
+    if isempty(real_pts)
+        return _empty_crit_pts_df(TR.dim)
+    end
+
     # Validate input dimensions
     if !all(p -> length(p) == TR.dim, real_pts)
         error("All points must have the same dimension as TR.dim ($(TR.dim))")
@@ -37,12 +42,12 @@ function process_crit_pts(
     filtered_points = real_pts
     if !skip_filtering
         # Filter points in [-1,1]^n hypercube
-        filtered_points = filter(p -> all(-1 .<= p .<= 1), real_pts)
+        filtered_points = filter(p -> all(c -> -1 <= c <= 1, p), real_pts)
 
         # Handle case where all points were filtered out
-        if isempty(filtered_points) && !isempty(real_pts)
+        if isempty(filtered_points)
             # Find the maximum absolute value
-            max_abs_val = maximum(abs.(reduce(vcat, real_pts)))
+            max_abs_val = maximum(p -> maximum(abs, p), real_pts)
 
             # If the points are not too far outside, use them anyway
             if max_abs_val < 10.0
@@ -53,9 +58,7 @@ function process_crit_pts(
 
     # Handle case with no valid points
     if isempty(filtered_points)
-        result = Dict(Symbol("x$i") => Float64[] for i in 1:(TR.dim))
-        result[:z] = Float64[]
-        return DataFrame(result)
+        return _empty_crit_pts_df(TR.dim)
     end
 
     # Transform points using TestInput parameters with support for per-coordinate scaling
@@ -123,6 +126,13 @@ function process_crit_pts(
     )
 end
 
+# Empty process_crit_pts result: columns x1..xn and z, no rows
+function _empty_crit_pts_df(dim::Int)::DataFrame
+    result = Dict(Symbol("x$i") => Float64[] for i in 1:dim)
+    result[:z] = Float64[]
+    return DataFrame(result)
+end
+
 # ── msolve output parsing (N-dimensional) ─────────────────────────────────────
 
 """
@@ -984,10 +984,10 @@ function estimate_subdomain_error(
     poly_values = evaluate_polynomial_at_samples(pol, grid_matrix)
     errors = f_values .- poly_values
     weight = prod(2.0 ./ (per_dim_GN .+ 1))
-    l2_error = sqrt(sum(abs2.(errors)) * weight)
+    l2_error = sqrt(sum(abs2, errors) * weight)
 
     # Compute relative L2 error: ||f - p||_L2 / ||f||_L2
-    norm_f = sqrt(sum(abs2.(f_values)) * weight)
+    norm_f = sqrt(sum(abs2, f_values) * weight)
     rel_l2 = if norm_f > 0
         l2_error / norm_f
     elseif l2_error == 0.0
@@ -1049,7 +1049,7 @@ function construct_polynomial_on_subdomain(
     per_dim_GN = 2 .* per_dim_degrees
     weight = prod(2.0 ./ (per_dim_GN .+ 1))
     residuals = f_values .- poly_values
-    nrm = sqrt(sum(abs2.(residuals)) * weight)
+    nrm = sqrt(sum(abs2, residuals) * weight)
 
     # Create ApproxPoly with anisotropic scale_factor
     return ApproxPoly{Float64}(
@@ -123,7 +123,7 @@ function compute_l2_norm_vandermonde(pol::ApproxPoly; grid_points = nothing)
     weights = compute_quadrature_weights(pol.basis, GN, dim)
 
     # Compute weighted L2-norm: ||p||₂ = sqrt(Σ w_i * p(x_i)²)
-    return sqrt(sum(abs2.(p_values) .* weights))
+    return sqrt(sum(i -> abs2(p_values[i]) * weights[i], eachindex(p_values, weights)))
 end
 
 """
@@ -167,7 +167,7 @@ function compute_l2_norm_coeffs(pol::ApproxPoly, coeffs::Vector; grid_points = n
     weights = compute_quadrature_weights(pol.basis, GN, dim)
 
     # Compute weighted L2-norm
-    return sqrt(sum(abs2.(p_values) .* weights))
+    return sqrt(sum(i -> abs2(p_values[i]) * weights[i], eachindex(p_values, weights)))
 end
 
 """
@@ -201,7 +201,7 @@ function sparsify_polynomial(
 
     # Determine threshold
     if mode == :relative
-        max_coeff = maximum(abs.(pol.coeffs))
+        max_coeff = maximum(abs, pol.coeffs)
         actual_threshold = threshold * max_coeff
     else
         actual_threshold = threshold
@@ -298,7 +298,7 @@ function compute_approximation_error(f::Function, pol::ApproxPoly, TR; n_points
 
     # Compute L2 norm using simple quadrature
     weight = (2.0 / n_points)^dim
-    l2_error = sqrt(sum(abs2.(errors)) * weight)
+    l2_error = sqrt(sum(abs2, errors) * weight)
 
     return l2_error
 end
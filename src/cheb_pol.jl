@@ -245,6 +245,42 @@ function evaluate_chebyshev(T, x_val::Number)
     return DynamicPolynomials.subs(T, x => x_val)
 end
 
+"""
+    _clenshaw_chebyshev(c::AbstractVector, x::Number)
+
+Evaluate the Chebyshev series `∑ₖ c[k+1] Tₖ(x)` with Clenshaw's recurrence
+`bₖ = cₖ + 2x bₖ₊₁ - bₖ₊₂`, `f = c₀ + x b₁ - b₂`. Only the coefficients are
+read, so no table of basis values is needed. Generic in the element types,
+so ForwardDiff dual numbers pass through.
+"""
+function _clenshaw_chebyshev(c::AbstractVector, x::Number)
+    T = promote_type(eltype(c), typeof(x))
+    isempty(c) && return zero(T)
+    b1 = zero(T)
+    b2 = zero(T)
+    for k in lastindex(c):-1:(firstindex(c)+1)
+        b1, b2 = muladd(2x, b1, c[k] - b2), b1
+    end
+    return muladd(x, b1, c[firstindex(c)] - b2)
+end
+
+"""
+    _chebyshev_derivative_coeffs(c::AbstractVector)
+
+Chebyshev coefficients of the derivative of `∑ₖ c[k+1] Tₖ(x)`, from the backward
+recurrence `c'ₖ₋₁ = c'ₖ₊₁ + 2k cₖ` (with `c'₀` halved at the end). The result has
+one entry fewer than `c` and can be passed to `_clenshaw_chebyshev`.
+"""
+function _chebyshev_derivative_coeffs(c::AbstractVector)
+    N = length(c) - 1
+    dc = zeros(eltype(c), max(N, 0))
+    for k in N:-1:1
+        dc[k] = (k + 1 <= N - 1 ? dc[k+2] : zero(eltype(c))) + 2k * c[k+1]
+    end
+    N >= 1 && (dc[1] /= 2)
+    return dc
+end
+
 function get_chebyshev_coeffs(
     max_degree::Integer;
     precision::PrecisionType = RationalPrecision,
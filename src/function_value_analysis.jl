@@ -98,16 +98,32 @@ function compute_function_value_errors(
 )
     errors = FunctionValueError[]
 
+    # Gradient buffer and GradientConfig shared across all matched pairs
+    grad_cfg, grad_buf = if compute_gradients && !isempty(theoretical_points)
+        x0 = first(theoretical_points)
+        ForwardDiff.GradientConfig(f, x0), similar(x0)
+    else
+        nothing, nothing
+    end
+
     # Match each theoretical point to its closest computed point
     for (i, theo_pt) in enumerate(theoretical_points)
         if isempty(computed_points)
             continue
         end
 
-        # Find closest computed point
-        distances = [norm(theo_pt - comp_pt) for comp_pt in computed_points]
-        min_idx = argmin(distances)
-        min_dist = distances[min_idx]
+        # Find closest computed point: running minimum of squared distances, no
+        # per-pair difference vector or distances array
+        min_idx = 0
+        min_dist2 = Inf
+        for (j, comp_pt) in enumerate(computed_points)
+            d2 = sum(k -> abs2(theo_pt[k] - comp_pt[k]), eachindex(theo_pt, comp_pt))
+            if min_idx == 0 || d2 < min_dist2
+                min_idx = j
+                min_dist2 = d2
+            end
+        end
+        min_dist = sqrt(min_dist2)
 
         # Only match if within threshold
         if min_dist <= match_threshold
@@ -126,10 +142,10 @@ function compute_function_value_errors(
             grad_norm_comp = 0.0
             if compute_gradients
                 try
-                    grad_theo = ForwardDiff.gradient(f, theo_pt)
-                    grad_norm_theo = norm(grad_theo)
-                    grad_comp = ForwardDiff.gradient(f, comp_pt)
-                    grad_norm_comp = norm(grad_comp)
+                    ForwardDiff.gradient!(grad_buf, f, theo_pt, grad_cfg)
+                    grad_norm_theo = norm(grad_buf)
+                    ForwardDiff.gradient!(grad_buf, f, comp_pt, grad_cfg)
+                    grad_norm_comp = norm(grad_buf)
                 catch e
                     @debug "Gradient computation failed" exception = (e, catch_backtrace())
                     grad_norm_theo = NaN
@@ -143,6 +143,8 @@ V = lambda_vandermonde_anisotropic(Lambda, S, basis=:chebyshev)
 # Performance Notes
 - Pre-computation of polynomial values reduces redundant calculations
 - Caching strategy scales linearly with sum of unique points per dimension
+- Node indices are resolved once up front and the per-degree value vectors once per column;
+  columns are filled in parallel with `Threads.@threads`
 - For isotropic grids, consider using standard `lambda_vandermonde` for better performance
 """
 function lambda_vandermonde_anisotropic(
@@ -161,8 +163,8 @@ function lambda_vandermonde_anisotropic(
     @assert N == n_dims "Dimension mismatch: Lambda has $N dimensions but grid has $n_dims"
     @assert n_points == size(S, 1) "Grid info mismatch"
 
-    # Initialize output matrix
-    V = zeros(T, n_points, m)
+    # Initialize output matrix (every entry is written below)
+    V = Matrix{T}(undef, n_points, m)
 
     # Find maximum degree needed per dimension
     max_degrees = zeros(Int, n_dims)
@@ -225,21 +227,31 @@ function lambda_vandermonde_anisotropic(
         throw(ArgumentError("Unsupported basis: $basis. Use :chebyshev or :legendre"))
     end
 
-    # Construct Vandermonde matrix
-    for i in 1:n_points
-        for j in 1:m
+    # Resolve every (point, dimension) node index ONCE, so the hot loop below
+    # does plain array reads instead of Dict lookups keyed on Float values
+    point_indices_matrix = Matrix{Int}(undef, n_points, n_dims)
+    for k in 1:n_dims
+        for i in 1:n_points
+            point_indices_matrix[i, k] = info.point_indices_per_dim[k][S[i, k]]
+        end
+    end
+
+    # Construct Vandermonde matrix: threads over columns (j), column-major
+    # traversal inside each column — same scheme as lambda_vandermonde_tensorized.
+    # The degrees, and hence the cached 1D value vectors, are fixed per column:
+    # resolve them once per column so the inner loops only index plain arrays.
+    Threads.@threads for j in 1:m
+        cols = Vector{Vector{T}}(undef, n_dims)
+        for k in 1:n_dims
+            cols[k] = eval_cache_per_dim[k][Int(Lambda.data[j, k])]
+        end
+
+        for i in 1:n_points
             P = one(T)
 
             # Product over dimensions
             for k in 1:n_dims
-                degree = Int(Lambda.data[j, k])
-                point = S[i, k]
-
-                # Find index of this point in the unique points for dimension k
-                point_idx = info.point_indices_per_dim[k][point]
-
-                # Multiply by cached polynomial value
-                P *= eval_cache_per_dim[k][degree][point_idx]
+                P *= cols[k][point_indices_matrix[i, k]]
             end
 
             V[i, j] = P
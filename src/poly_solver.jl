@@ -57,6 +57,10 @@ Find all critical points of a polynomial approximation by solving the gradient s
 - `power_of_two_denom::Bool=false`: For rational precision, ensures denominators are powers of 2
 - `return_system::Bool=false`: If true, also return the polynomial system information (`:hc` only)
 - `msolve_threads::Int=1`: Number of threads for msolve (`:msolve` only)
+- `hc_compile=nothing`: Forwarded to `HomotopyContinuation.solve` as `compile` (`true`/`:all`
+  compiles the gradient system and homotopy to straight-line code, `false`/`:none`
+  interprets them, `:mixed` compiles only the system; other values throw `ArgumentError`).
+  `nothing` keeps the HomotopyContinuation default (`:hc` only)
 
 # Returns
 - If `return_system=false`: `Vector{Vector{Float64}}` — Real solutions within [-1,1]ⁿ
@@ -100,6 +104,7 @@ TimerOutputs.@timeit _TO function solve_polynomial_system(
     msolve_threads::Int = 1,
     msolve_timeout_seconds::Union{Nothing,Float64} = nothing,
     search_bounds::Union{Vector{Tuple{Float64,Float64}},Nothing} = nothing,
+    hc_compile::Union{Nothing,Bool,Symbol} = nothing,
 )
     # Optional coefficient sparsification: zero out small coefficients before
     # constructing the DynamicPolynomials polynomial. DynamicPolynomials automatically
@@ -130,6 +135,7 @@ TimerOutputs.@timeit _TO function solve_polynomial_system(
             power_of_two_denom,
             return_system,
             start_system,
+            compile = hc_compile,
         )
         # Apply search_bounds as midpoint filter for HC (no interval data available)
         if search_bounds !== nothing && !return_system
@@ -360,6 +366,7 @@ function solve_polynomial_system_from_approx(
     msolve_threads::Int = 1,
     msolve_timeout_seconds::Union{Nothing,Float64} = nothing,
     search_bounds::Union{Vector{Tuple{Float64,Float64}},Nothing} = nothing,
+    hc_compile::Union{Nothing,Bool,Symbol} = nothing,
 )::Vector{Vector{Float64}}
     return solve_polynomial_system(
         x,
@@ -374,6 +381,7 @@ function solve_polynomial_system_from_approx(
         msolve_threads = msolve_threads,
         msolve_timeout_seconds = msolve_timeout_seconds,
         search_bounds = search_bounds,
+        hc_compile = hc_compile,
     )
 end
 
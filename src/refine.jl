@@ -104,26 +104,28 @@ Vector{Float64}: Distance to nearest other point for each point
 """
 function compute_nearest_neighbors(df::DataFrame, n_dims::Int)::Vector{Float64}
     n_points = nrow(df)
-    distances = Vector{Float64}(undef, n_points)
+    # Squared nearest-neighbor distances; sqrt is applied once at the end
+    distances = fill(Inf, n_points)
 
-    # Extract coordinates
-    coords = Matrix{Float64}(undef, n_points, n_dims)
-    for i in 1:n_dims
-        coords[:, i] = df[!, Symbol("x$i")]
+    # Extract coordinates, one point per column
+    coords = Matrix{Float64}(undef, n_dims, n_points)
+    for k in 1:n_dims
+        coords[k, :] = df[!, Symbol("x$k")]
     end
 
+    # Each unordered pair once (j > i), updating both endpoints
     for i in 1:n_points
-        min_dist = Inf
-        for j in 1:n_points
-            if i != j
-                dist = norm(coords[i, :] - coords[j, :])
-                min_dist = min(min_dist, dist)
+        for j in (i+1):n_points
+            d2 = 0.0
+            for k in 1:n_dims
+                d2 += abs2(coords[k, i] - coords[k, j])
             end
+            distances[i] = min(distances[i], d2)
+            distances[j] = min(distances[j], d2)
         end
-        distances[i] = min_dist
     end
 
-    return distances
+    return sqrt.(distances)
 end
 
 """
@@ -146,10 +148,16 @@ function compute_gradients(f, points::Matrix{Float64})::Vector{Float64}
     failed_points = Int[]
     failure_types = Set{String}()
 
+    # One point buffer, gradient buffer and GradientConfig (dual seeds + work
+    # array) shared by every point, instead of rebuilding them per call
+    point = Vector{Float64}(undef, n_dims)
+    grad = Vector{Float64}(undef, n_dims)
+    cfg = ForwardDiff.GradientConfig(f, point)
+
     for i in 1:n_points
         try
-            point = Vector{Float64}(points[i, :])
-            grad = ForwardDiff.gradient(f, point)
+            copyto!(point, view(points, i, :))
+            ForwardDiff.gradient!(grad, f, point, cfg)
             grad_norms[i] = norm(grad)
         catch e
             push!(failed_points, i)
@@ -437,9 +445,9 @@ function _refine_critical_points!(
             optim_converged = Optim.converged(res)
 
             within_bounds = if isa(TR.sample_range, Number)
-                all(abs.(minimizer .- TR.center[1:n_dims]) .<= TR.sample_range)
+                all(j -> abs(minimizer[j] - TR.center[j]) <= TR.sample_range, 1:n_dims)
             else
-                all(abs.(minimizer[j] - TR.center[j]) <= TR.sample_range[j] for j in 1:n_dims)
+                all(j -> abs(minimizer[j] - TR.center[j]) <= TR.sample_range[j], 1:n_dims)
             end
             converged = optim_converged && within_bounds
 
@@ -88,7 +88,7 @@ function compute_norm(scale_factor::Float64, VL, sol, F, basis::Symbol, GN::Int,
     end
 
     # Compute weighted L2-norm
-    return sqrt(sum(abs2.(residuals) .* weights))
+    return sqrt(sum(i -> abs2(residuals[i]) * weights[i], eachindex(residuals, weights)))
 end
 
 function compute_norm(
@@ -117,7 +117,7 @@ function compute_norm(
     end
 
     # Compute weighted L2-norm
-    return sqrt(sum(abs2.(residuals) .* weights))
+    return sqrt(sum(i -> abs2(residuals[i]) * weights[i], eachindex(residuals, weights)))
 end
 
 """
@@ -136,7 +136,7 @@ function relative_l2_error(pol::ApproxPoly)
     # Grid has (GN+1)^dim points, so GN = round(N^(1/dim)) - 1
     GN = round(Int, pol.N^(1 / dim)) - 1
     weights = compute_quadrature_weights(pol.basis, GN, dim)
-    norm_F = sqrt(sum(abs2.(pol.z) .* weights))
+    norm_F = sqrt(sum(i -> abs2(pol.z[i]) * weights[i], eachindex(pol.z, weights)))
     return norm_F > 0 ? pol.nrm / norm_F : NaN
 end
 
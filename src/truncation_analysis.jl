@@ -48,7 +48,7 @@ function truncate_polynomial(
 
     # Determine threshold
     if mode == :relative
-        max_coeff = maximum(abs.(coeffs))
+        max_coeff = maximum(abs, coeffs)
         actual_threshold = coeff_threshold * max_coeff
     else
         actual_threshold = coeff_threshold
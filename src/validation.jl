@@ -821,7 +821,7 @@ function validate_hpc_to_collection_boundary(data::Any, context::Dict{String,Any
         # Check for suspicious data quality patterns
         if "z" in names(data)
             z_values = collect(skipmissing(data.z))
-            if !isempty(z_values) && all(isa.(z_values, Number))
+            if !isempty(z_values) && all(z -> z isa Number, z_values)
                 if any(z -> z < 0, z_values)
                     push!(
                         warnings,
@@ -1188,7 +1188,7 @@ function detect_interface_issues(data::Any; context::Dict{String,Any} = Dict{Str
         # Data type interface issues
         if "degree" in column_names
             degrees = collect(skipmissing(data.degree))
-            if !isempty(degrees) && !all(isa.(degrees, Number))
+            if !isempty(degrees) && !all(d -> d isa Number, degrees)
                 push!(
                     errors,
                     InterfaceCompatibilityError(
@@ -265,3 +265,19 @@ end
 with_timeout(TIMEOUT_SOLVE, label = "test_warmstart_solve.jl") do
     include("test_warmstart_solve.jl")
 end
+
+with_timeout(TIMEOUT_TESTFILE, label = "test_gram_solve_options.jl") do
+    include("test_gram_solve_options.jl")
+end
+
+with_timeout(TIMEOUT_TESTFILE, label = "test_vandermonde_anisotropic.jl") do
+    include("test_vandermonde_anisotropic.jl")
+end
+
+with_timeout(TIMEOUT_TESTFILE, label = "test_critical_point_diagnostics.jl") do
+    include("test_critical_point_diagnostics.jl")
+end
+
+with_timeout(TIMEOUT_TESTFILE, label = "test_symmetry_sampling.jl") do
+    include("test_symmetry_sampling.jl")
+end
@@ -0,0 +1,98 @@
+using Test
+using Globtim
+using DataFrames
+using LinearAlgebra
+# ForwardDiff via Globtim (which depends on it); it is not a direct test dependency
+import Globtim.ForwardDiff
+
+# Per-point diagnostics used when post-processing critical points (refine.jl).
+
+# Brute-force reference: distance from each point to its nearest other point
+function _nn_bruteforce(P::Matrix{Float64})
+    n = size(P, 1)
+    return [
+        minimum((norm(P[i, :] - P[j, :]) for j in 1:n if j != i); init = Inf) for
+        i in 1:n
+    ]
+end
+
+_crit_df(P::Matrix{Float64}) = DataFrame(P, ["x$k" for k in 1:size(P, 2)])
+
+@testset "compute_nearest_neighbors matches brute force" begin
+    P = [
+        0.1 0.2 -0.3
+        0.4 -0.7 0.0
+        -0.9 0.5 0.25
+        0.35 -0.6 0.1
+        0.0 0.0 0.0
+        0.8 0.8 -0.8
+    ]
+    @test Globtim.compute_nearest_neighbors(_crit_df(P), 3) ≈ _nn_bruteforce(P)
+
+    # Single point: no other point to measure against
+    @test Globtim.compute_nearest_neighbors(_crit_df([0.3 -0.2]), 2) == [Inf]
+
+    # Duplicated point: both copies are at distance 0, the others are unaffected
+    D = [
+        0.5 0.5
+        -0.25 0.75
+        0.5 0.5
+        -1.0 -1.0
+    ]
+    nn = Globtim.compute_nearest_neighbors(_crit_df(D), 2)
+    @test nn[1] == 0.0
+    @test nn[3] == 0.0
+    @test nn ≈ _nn_bruteforce(D)
+end
+
+_smooth_obj(x) = sum(abs2, x) + sin(x[1]) * x[2]
+# Differentiation fails (but plain evaluation succeeds) for x[1] > 0.5
+_flaky_grad_obj(x) =
+    eltype(x) <: ForwardDiff.Dual && x[1] > 0.5 ? error("no derivative here") :
+    _smooth_obj(x)
+
+_fd_grad_norm(x) = norm(ForwardDiff.gradient(_smooth_obj, x))
+
+@testset "shared gradient buffers match ForwardDiff.gradient" begin
+    P = [
+        0.1 0.2
+        0.9 -0.3
+        -0.4 0.7
+        0.3 -0.8
+    ]
+
+    @testset "compute_gradients" begin
+        @test Globtim.compute_gradients(_smooth_obj, P) ≈
+              [_fd_grad_norm(P[i, :]) for i in 1:4]
+
+        # A failing point yields NaN; later points get their own gradient,
+        # not leftovers from the shared buffer
+        g = @test_logs (:warn, r"Gradient computation failed") Globtim.compute_gradients(
+            _flaky_grad_obj,
+            P,
+        )
+        @test isnan(g[2])
+        @test g[[1, 3, 4]] ≈ [_fd_grad_norm(P[i, :]) for i in (1, 3, 4)]
+    end
+
+    @testset "compute_function_value_errors" begin
+        theo = [P[i, :] for i in 1:4]
+        comp = [p .+ [0.01, -0.02] for p in theo]
+
+        errs = Globtim.compute_function_value_errors(theo, comp, _smooth_obj)
+        @test length(errs) == 4
+        for (e, t, c) in zip(errs, theo, comp)
+            @test e.gradient_norm_theoretical ≈ _fd_grad_norm(t)
+            @test e.gradient_norm_computed ≈ _fd_grad_norm(c)
+        end
+
+        errs = Globtim.compute_function_value_errors(theo, comp, _flaky_grad_obj)
+        @test length(errs) == 4
+        @test isnan(errs[2].gradient_norm_theoretical)
+        @test isnan(errs[2].gradient_norm_computed)
+        for i in (1, 3, 4)
+            @test errs[i].gradient_norm_theoretical ≈ _fd_grad_norm(theo[i])
+            @test errs[i].gradient_norm_computed ≈ _fd_grad_norm(comp[i])
+        end
+    end
+end
@@ -49,3 +49,68 @@ using LinearAlgebra
     pol_leg = Constructor(TR, 12, basis = :legendre, normalized = true)
     @test pol_leg.normalized == true
 end
+
+@testset "batch evaluate matches pointwise evaluate" begin
+    f = x -> exp(0.4 * x[1]) * sin(1.7 * x[2]) + 0.25 * x[1]^2
+    for (basis, sf) in ((:chebyshev, 0.7), (:legendre, [0.7, 0.4]))
+        TR = TestInput(f, dim = 2, center = [0.15, -0.05], GN = 20, sample_range = sf)
+        pol = Constructor(TR, 8, basis = basis)
+        X = pol.center' .+ (2 .* rand(25, 2) .- 1) .* pol.scale_factor'
+        @test Globtim.evaluate(pol, X) ≈ [Globtim.evaluate(pol, X[i, :]) for i in 1:25]
+    end
+end
+
+@testset "1D Chebyshev evaluate (Clenshaw) matches the T_d expansion" begin
+    TR = TestInput(x -> sin(3x) + x^2, dim = 1, center = [0.2], GN = 30, sample_range = 1.5)
+    pol = Constructor(TR, 14, basis = :chebyshev)
+    for t in (-0.9, -0.3, 0.0, 0.45, 1.0)
+        x = pol.center[1] + pol.scale_factor * t
+        expected = sum(
+            pol.coeffs[j] * cos(pol.support[j, 1] * acos(t)) for j in eachindex(pol.coeffs)
+        )
+        @test Globtim.evaluate(pol, [x]) ≈ expected atol = 1e-12
+    end
+    X = reshape(pol.center[1] .+ pol.scale_factor .* range(-1, 1, length = 11), :, 1)
+    @test Globtim.evaluate(pol, X) ≈ [Globtim.evaluate(pol, X[i, :]) for i in 1:11]
+end
+
+@testset "analytic gradient matches finite differences of evaluate" begin
+    f = x -> exp(0.4 * x[1]) * sin(1.7 * x[2]) + 0.25 * x[1]^2 * x[3]
+    for (basis, nrm_req, sf) in
+        ((:chebyshev, false, 0.7), (:legendre, true, [0.7, 0.4, 0.9]), (:legendre, false, 0.5))
+        TR = TestInput(f, dim = 3, center = [0.15, -0.05, 0.1], GN = 12, sample_range = sf)
+        pol = Constructor(TR, 6, basis = basis, normalized = nrm_req)
+        h = 1e-6
+        for t in ([0.1, 0.0, -0.2], [0.5, 0.3, 0.8], [-0.9, -0.4, 0.0])
+            x = pol.center .+ pol.scale_factor .* t
+            g_fd = [
+                (Globtim.evaluate(pol, x .+ h .* (1:3 .== k)) -
+                 Globtim.evaluate(pol, x .- h .* (1:3 .== k))) / (2h) for k in 1:3
+            ]
+            @test Globtim.gradient(pol, x) ≈ g_fd rtol = 1e-6 atol = 1e-8
+        end
+        X = pol.center' .+ (2 .* rand(7, 3) .- 1) .* pol.scale_factor'
+        G = Globtim.gradient(pol, X)
+        @test size(G) == (7, 3)
+        @test G ≈ reduce(vcat, (Globtim.gradient(pol, X[i, :])' for i in 1:7))
+    end
+end
+
+@testset "1D Chebyshev gradient matches d/dx of the T_d expansion" begin
+    TR = TestInput(x -> sin(3x) + x^2, dim = 1, center = [0.2], GN = 30, sample_range = 1.5)
+    for nrm_req in (false, true)
+        pol = Constructor(TR, 14, basis = :chebyshev, normalized = nrm_req)
+        lambda = Matrix(pol.support)
+        c = Globtim._dense_chebyshev_coeffs(pol.coeffs, lambda, pol.normalized, 14)
+        for t in (-0.9, -0.3, 0.0, 0.45, 0.95)
+            x = pol.center[1] + pol.scale_factor * t
+            # T_d'(cos θ) = d sin(dθ) / sin θ
+            θ = acos(t)
+            expected = sum(c[d+1] * d * sin(d * θ) / sin(θ) for d in 1:14) / pol.scale_factor
+            @test Globtim.gradient(pol, [x]) ≈ [expected] rtol = 1e-10
+        end
+        X = reshape(pol.center[1] .+ pol.scale_factor .* range(-1, 1, length = 9), :, 1)
+        g_rows = [Globtim.gradient(pol, X[i, :])[1] for i in 1:9]
+        @test vec(Globtim.gradient(pol, X)) ≈ g_rows
+    end
+end
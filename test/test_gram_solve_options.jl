@@ -0,0 +1,65 @@
+using Test
+using Globtim
+using LinearAlgebra
+
+# Tests for the linear-solve paths of MainGenerate / Constructor. Each option
+# must leave the fitted polynomial unchanged up to rounding and must not alter
+# the default path. The opt-in options act on the dense Gram solve, so they are
+# exercised with the Legendre basis (Chebyshev fits on the generated grid take
+# the diagonal fast path).
+
+@testset "Gram solve options" begin
+    TR = TestInput(Deuflhard, dim = 2, center = [0.0, 0.0], GN = 20, sample_range = 1.2)
+
+    @testset "Chebyshev on Chebyshev nodes: diagonal Gram matches dense solve" begin
+        f3 = x -> exp(0.5 * x[1] - x[2]) * cos(x[3]) + x[1] * x[2]
+        for (n, f, GN, deg) in ((2, Deuflhard, 20, 8), (3, f3, 8, 6))
+            TRn = TestInput(f, dim = n, center = zeros(n), GN = GN, sample_range = 0.9)
+            pol = Constructor(TRn, deg)
+
+            Lambda = Globtim.SupportGen(n, (:one_d_for_all, deg))
+            VL = Globtim.lambda_vandermonde(Lambda, pol.grid, basis = :chebyshev)
+            G = VL' * VL
+            @test pol.coeffs ≈ G \ (VL' * pol.z) rtol = 1e-10
+            @test pol.cond_vandermonde ≈ cond(G) rtol = 1e-8
+        end
+    end
+
+    @testset "equilibrate (Jacobi scaling of the Gram matrix)" begin
+        for nrm_req in (true, false)
+            p_ref = Constructor(TR, 8; basis = :legendre, normalized = nrm_req)
+            p_eq = Constructor(
+                TR,
+                8;
+                basis = :legendre,
+                normalized = nrm_req,
+                equilibrate = true,
+            )
+
+            @test p_eq.coeffs ≈ p_ref.coeffs rtol = 1e-8
+            @test p_eq.nrm ≈ p_ref.nrm rtol = 1e-8
+            # Diagnostic still refers to the unscaled Gram matrix
+            @test p_eq.cond_vandermonde == p_ref.cond_vandermonde
+        end
+    end
+
+    @testset "mixed_precision (Float32 LU + Float64 refinement)" begin
+        p_ref = Constructor(TR, 8; basis = :legendre)
+        p_mp = Constructor(TR, 8; basis = :legendre, mixed_precision = true)
+        @test p_mp.coeffs ≈ p_ref.coeffs rtol = 1e-8
+        @test p_mp.nrm ≈ p_ref.nrm rtol = 1e-8
+
+        p_both =
+            Constructor(TR, 8; basis = :legendre, mixed_precision = true, equilibrate = true)
+        @test p_both.coeffs ≈ p_ref.coeffs rtol = 1e-8
+
+        # Refinement reaches Float64 accuracy on a well-conditioned SPD system
+        B = [1.0 / (1 + abs(i - j)) for i in 1:30, j in 1:30] + 30I
+        b = collect(range(-1.0, 1.0, length = 30))
+        @test Globtim._mixed_precision_solve(B, b) ≈ B \ b rtol = 1e-12
+
+        # Hilbert matrix (cond ≈ 1e16) is beyond Float32: fail loudly, no silent fallback
+        H = [1.0 / (i + j - 1) for i in 1:12, j in 1:12]
+        @test_throws ErrorException Globtim._mixed_precision_solve(H, ones(12))
+    end
+end
@@ -58,4 +58,39 @@
         start_system = :polyhedral,
     )
     @test length(cps_approx) >= 1
+
+    # ── 6. hc_compile reaches HC's `compile`: the compiled and interpreted
+    #       evaluators track to the same real critical points as the default
+    for hc_compile in (true, false)
+        cps_c = solve_polynomial_system(
+            x,
+            n,
+            d,
+            pol.coeffs;
+            basis = :chebyshev,
+            normalized = true,
+            start_system = :total_degree,
+            hc_compile = hc_compile,
+        )
+        @test length(cps_c) == length(cps_td)
+        @test all(p -> any(q -> norm(p - q) < 1e-6, cps_td), cps_c)
+    end
+    cps_approx_c = Globtim.solve_polynomial_system_from_approx(x, pol; hc_compile = true)
+    @test length(cps_approx_c) >= 1
+
+    # An unknown mode is rejected where the keyword is handed to HC
+    @test_throws ArgumentError solve_polynomial_system(
+        x,
+        n,
+        d,
+        pol.coeffs;
+        basis = :chebyshev,
+        normalized = true,
+        hc_compile = :bogus,
+    )
+    @test_throws ArgumentError Globtim.solve_polynomial_system_from_approx(
+        x,
+        pol;
+        hc_compile = :bogus,
+    )
 end
@@ -0,0 +1,29 @@
+using Test
+using Globtim
+
+# `symmetry = :even` in MainGenerate / Constructor: the objective is evaluated on
+# half of the generated grid and mirrored onto the other half. The fit must match
+# the full-grid fit while calling the objective half as often.
+
+@testset "symmetry = :even halves the grid evaluations" begin
+    n_calls = Ref(0)
+    counted(x) = (n_calls[] += 1; Deuflhard(x))
+    for GN in (19, 20)  # even and odd node counts per axis
+        TR = TestInput(counted, dim = 2, center = [0.0, 0.0], GN = GN, sample_range = 1.2)
+
+        n_calls[] = 0
+        p_ref = Constructor(TR, 8)
+        n_full = n_calls[]
+
+        n_calls[] = 0
+        p_sym = Constructor(TR, 8; symmetry = :even)
+        @test n_calls[] == cld(n_full, 2)
+        @test p_sym.coeffs ≈ p_ref.coeffs rtol = 1e-10
+        @test p_sym.z ≈ p_ref.z rtol = 1e-10
+    end
+
+    TR = TestInput(Deuflhard, dim = 2, center = [0.0, 0.0], GN = 10, sample_range = 1.2)
+    @test_throws ArgumentError Constructor(TR, 4; symmetry = :odd)
+    grid = Globtim.convert_to_matrix_grid(vec(generate_grid(2, 10)))
+    @test_throws ArgumentError Constructor(TR, 4; grid = grid, symmetry = :even)
+end